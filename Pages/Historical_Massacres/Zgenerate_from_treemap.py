@@ -6,7 +6,24 @@ Usage: python generate_from_treemap.py <treemap_file>
 
 import os
 import sys
-import re
+
+try:
+    import liburing
+except ImportError:
+    liburing = None
+
+# Number of file operations submitted to io_uring per batch
+_URING_QUEUE_DEPTH = 256
+
+# Whitespace (same set as the regex \s) plus every tree drawing character stripped from a line
+_TREE_CHARS = (
+    '\t\n\x0b\x0c\r\x1c\x1d\x1e\x1f \x85\xa0\u1680\u2000\u2001\u2002\u2003\u2004\u2005'
+    '\u2006\u2007\u2008\u2009\u200a\u2028\u2029\u202f\u205f\u3000'
+    '│┃┆├└┌┐┤┴┬┼─━┄┈╌╍╎╏╭╮╯╰╱╲╳▕▏▎▍▌▋▊▉█▓▒░■□▪▫'
+)
+
+# First characters that mark a line as nested under the current directory
+_INDENT_STARTS = frozenset((' ', '\t', '├', '└', '│'))
 
 
 def parse_treemap(content):
@@ -14,7 +31,8 @@ def parse_treemap(content):
     Parse treemap content and extract directory structure.
     Returns a list of full paths.
     """
-    lines = content.strip().split('\n')
+    # lstrip keeps the first entry unindented (and is a no-op copy-wise when there is nothing to strip)
+    lines = content.lstrip().splitlines()
     structure = []
     current_dir = None
 
@@ -24,7 +42,7 @@ def parse_treemap(content):
             continue
 
         # Remove all tree drawing characters and get the actual name
-        cleaned = re.sub(r'^[\s│┃┆├└┌┐┤┴┬┼─━┄┈╌╍╎╏╭╮╯╰╱╲╳▕▏▎▍▌▋▊▉█▓▒░■□▪▫]+', '', line)
+        cleaned = line.lstrip(_TREE_CHARS)
         name = cleaned.strip()
 
         if not name:
@@ -32,7 +50,7 @@ def parse_treemap(content):
 
         # Check if this line starts at column 0 (no indentation after cleaning tree chars)
         # A line with no leading spaces in original = top level
-        has_indent = line.startswith(' ') or line.startswith('├') or line.startswith('└') or line.startswith('│')
+        has_indent = line[0] in _INDENT_STARTS
 
         # Determine if it's a directory (ends with /)
         is_dir = name.endswith('/')
@@ -45,7 +63,7 @@ def parse_treemap(content):
             structure.append((name, True))
         # If it has indentation and we have a current directory, it belongs inside
         elif has_indent and current_dir:
-            full_path = os.path.join(current_dir, name)
+            full_path = f"{current_dir}/{name}"
             structure.append((full_path, is_dir))
         # Otherwise it's a top-level file
         else:
@@ -54,53 +72,129 @@ def parse_treemap(content):
     return structure
 
 
-def create_structure(structure, base_path='.'):
+def _uring_reap(ring, cqe, count):
+    """
+    Wait for count io_uring completions.
+    Returns the successful results and the first error seen (or None).
+    """
+    results = []
+    error = None
+    for _ in range(count):
+        try:
+            liburing.io_uring_wait_cqe(ring, cqe)
+            results.append(cqe[0].res)
+        except OSError as e:
+            error = error or e
+        liburing.io_uring_cqe_seen(ring, cqe[0])
+    return results, error
+
+
+def _touch_files_uring(paths):
+    """
+    Create empty files through io_uring, one submission per batch of opens and closes.
+    Returns False if io_uring is not usable here so the caller can fall back.
+    """
+    ring = liburing.Ring()
+    cqe = liburing.Cqe()
+    try:
+        liburing.io_uring_queue_init(_URING_QUEUE_DEPTH, ring)
+    except OSError:
+        return False
+
+    how = liburing.OpenHow(os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644)
+    try:
+        for start in range(0, len(paths), _URING_QUEUE_DEPTH):
+            batch = paths[start:start + _URING_QUEUE_DEPTH]
+
+            for full_path in batch:
+                liburing.io_uring_prep_openat2(liburing.io_uring_get_sqe(ring), full_path, how)
+            liburing.io_uring_submit(ring)
+            fds, error = _uring_reap(ring, cqe, len(batch))
+
+            # Close whatever was opened, even if part of the batch failed
+            for fd in fds:
+                liburing.io_uring_prep_close(liburing.io_uring_get_sqe(ring), fd)
+            liburing.io_uring_submit(ring)
+            _uring_reap(ring, cqe, len(fds))
+
+            if error:
+                raise error
+    finally:
+        liburing.io_uring_queue_exit(ring)
+    return True
+
+
+def touch_files(paths):
+    """
+    Create (or truncate) empty files.
+    Uses io_uring on Linux when liburing is installed, plain syscalls otherwise.
+    """
+    if liburing is not None and sys.platform == 'linux' and _touch_files_uring(paths):
+        return
+
+    for full_path in paths:
+        os.close(os.open(full_path, os.O_CREAT | os.O_WRONLY | os.O_TRUNC, 0o644))
+
+
+def create_structure(structure, base_path='.', quiet=False):
     """
     Create directories and files based on parsed structure.
+    The per-item listing is written in one go at the end, or skipped when quiet.
     """
     created_dirs = []
     created_files = []
-
-    for path, is_dir in structure:
-        full_path = os.path.join(base_path, path)
-
+    log = []
+    # Treemap paths are always '/'-separated, which every OS we run on (Windows included) accepts
+    # An empty base_path means the current directory (relative paths), as with os.path.join
+    prefix = f"{base_path.rstrip('/')}/" if base_path else ''
+    entries = [(f"{prefix}{path}", is_dir) for path, is_dir in structure]
+
+    # Create every needed directory exactly once, shallowest first
+    needed_dirs = {full_path if is_dir else os.path.dirname(full_path) for full_path, is_dir in entries}
+    needed_dirs.discard('')
+    for directory in sorted(needed_dirs, key=lambda d: d.count('/')):
+        os.makedirs(directory, exist_ok=True)
+
+    # Create all empty files in one go
+    touch_files([full_path for full_path, is_dir in entries if not is_dir])
+
+    for full_path, is_dir in entries:
         if is_dir:
-            os.makedirs(full_path, exist_ok=True)
             created_dirs.append(full_path)
-            print(f"📁 Created directory: {full_path}")
+            log.append(f"📁 Created directory: {full_path}")
         else:
-            # Create parent directory if needed
-            parent = os.path.dirname(full_path)
-            if parent:
-                os.makedirs(parent, exist_ok=True)
-
-            # Create empty file
-            with open(full_path, 'w') as f:
-                pass
             created_files.append(full_path)
-            print(f"📄 Created file: {full_path}")
+            log.append(f"📄 Created file: {full_path}")
+
+    if log and not quiet:
+        sys.stdout.write('\n'.join(log) + '\n')
 
     return created_dirs, created_files
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python generate_from_treemap.py <treemap_file>")
+    args = sys.argv[1:]
+    quiet = '-q' in args or '--quiet' in args
+    args = [arg for arg in args if arg not in ('-q', '--quiet')]
+
+    if not args:
+        print("Usage: python generate_from_treemap.py [-q] <treemap_file>")
         print("\nOr pipe treemap content:")
         print("cat treemap.txt | python generate_from_treemap.py -")
         print("\nOr paste treemap and press Ctrl+D (Unix) or Ctrl+Z (Windows):")
         print("python generate_from_treemap.py -")
+        print("\n-q, --quiet  Don't list every created file and directory")
         sys.exit(1)
 
     # Read from file or stdin
-    if sys.argv[1] == '-' or not sys.stdin.isatty():
+    if args[0] == '-' or not sys.stdin.isatty():
         content = sys.stdin.read()
     else:
         try:
-            with open(sys.argv[1], 'r', encoding='utf-8') as f:
+            with open(args[0], 'r', encoding='utf-8') as f:
                 content = f.read()
         except FileNotFoundError:
-            print(f"Error: File '{sys.argv[1]}' not found")
+            print(f"Error: File '{args[0]}' not found")
             sys.exit(1)
 
     # Parse and create structure
@@ -114,7 +208,7 @@ def main():
     print(f"Found {len(structure)} items\n")
 
     # Create files and directories
-    created_dirs, created_files = create_structure(structure)
+    created_dirs, created_files = create_structure(structure, quiet=quiet)
 
     print(f"\n✅ Done!")
     print(f"   Created {len(created_dirs)} directories")
@@ -1,10 +1,320 @@
-import json
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+import orjson
 import sys
 import os
 import glob
+import functools
+import io
+from concurrent.futures import ProcessPoolExecutor
+
+try:
+    import pyexcelerate
+except ImportError:
+    # Fall back to openpyxl's streaming write-only mode
+    pyexcelerate = None
+    import openpyxl
+
+# Files at least this large are stream-parsed with ijson instead of being read whole by orjson
+_STREAM_MIN_BYTES = 64 * 1024 * 1024
+
+# (Main Info field, dotted path into the JSON document)
+_MAIN_INFO_FIELDS = (
+    ('id', 'id'),
+    ('event_type', 'event_type'),
+    ('verification_status', 'verification_status'),
+    ('pageTitle', 'metadata.pageTitle'),
+    ('description', 'metadata.description'),
+    ('keywords', 'metadata.keywords'),
+    ('lastUpdated', 'metadata.lastUpdated'),
+    ('author', 'metadata.author'),
+    ('date_start', 'date.start'),
+    ('date_end', 'date.end'),
+    ('date_duration_days', 'date.duration_days'),
+    ('date_display', 'date.display'),
+    ('date_context', 'date.context'),
+    ('brief_summary', 'brief_summary'),
+    ('hero_category', 'hero.category'),
+    ('hero_title', 'hero.title'),
+    ('hero_subtitle', 'hero.subtitle'),
+    ('deaths', 'casualties.deaths'),
+    ('injured', 'casualties.injured'),
+    ('forced_displacement', 'casualties.forced_displacement'),
+)
+
+
+def _dig(data, path):
+    """Follow a dotted path through nested dicts, returning '' when any step is missing"""
+    for key in path.split('.'):
+        data = data.get(key) if isinstance(data, dict) else None
+        if data is None:
+            return ''
+    return data
+
+
+def _load_json(json_file):
+    """
+    Parse a histXXX JSON file.
+    Files above _STREAM_MIN_BYTES are streamed section by section, keeping only those used by the sheets.
+    """
+    with open(json_file, 'rb') as f:
+        if os.fstat(f.fileno()).st_size < _STREAM_MIN_BYTES:
+            return orjson.loads(f.read())
+
+        # Only needed for huge files, so ijson is not imported (or required) otherwise
+        import ijson
+        try:
+            return {key: value for key, value in ijson.kvitems(f, '', use_float=True) if key in _SHEET_KEYS}
+        except ijson.JSONError as e:
+            # Surface as ValueError, like orjson.JSONDecodeError, so callers handle both parsers alike
+            raise ValueError(str(e)) from e
+
+
+def _new_workbook():
+    """Create an empty workbook with pyexcelerate, or a write-only openpyxl one if it is missing"""
+    if pyexcelerate is not None:
+        return pyexcelerate.Workbook()
+    return openpyxl.Workbook(write_only=True)
+
+
+def _write_sheet(wb, sheet_name, columns, rows):
+    """
+    Add a sheet made of a header row followed by the given data rows.
+    Rows must be lists: pyexcelerate copies list rows in one go but falls back to per-cell writes for anything else.
+    """
+    if pyexcelerate is not None:
+        wb.new_sheet(sheet_name, data=[list(columns)] + rows)
+        return
+
+    ws = wb.create_sheet(title=sheet_name)
+    ws.append(columns)
+    for row in rows:
+        ws.append(row)
+
+
+# Sheet row extractors. Each takes the top-level JSON section its sheet is built from.
+
+def _main_info_rows(data):
+    return [[field, _dig(data, path)] for field, path in _MAIN_INFO_FIELDS]
+
+
+def _location_rows(location):
+    return [
+        [
+            category,
+            key,
+            str(value) if not isinstance(value, (list, dict)) else orjson.dumps(value).decode('utf-8')
+        ]
+        for category in ('historical', 'current')
+        for key, value in location.get(category, {}).items()
+    ]
+
+
+def _hero_card_rows(hero):
+    return [
+        [card.get('icon', ''), card.get('label', ''), card.get('value', ''), card.get('detail', '')]
+        for card in hero.get('metaCards', [])
+    ]
+
+
+def _quick_fact_rows(quick_facts):
+    return [[item.get('label', ''), item.get('value', '')] for item in quick_facts.get('items', [])]
+
+
+def _single_column_rows(values):
+    return [[value] for value in values]
+
+
+def _commander_rows(personalities):
+    # Later positions are padded to exactly three columns
+    return [
+        [
+            person.get('name', ''),
+            person.get('name_hebrew', person.get('name_arabic', '')),
+            person.get('birth_death', ''),
+            person.get('role', ''),
+            person.get('responsibility', ''),
+            *((person.get('later_positions') or []) + ['', '', ''])[:3],
+            person.get('accountability', ''),
+            person.get('notes', '')
+        ]
+        for person in personalities.get('commanders', [])
+    ]
+
+
+def _witness_rows(personalities):
+    return [
+        [
+            person.get('name', ''),
+            person.get('name_hebrew', person.get('name_arabic', '')),
+            person.get('birth_death', ''),
+            person.get('role', ''),
+            person.get('responsibility', ''),
+            person.get('notes', '')
+        ]
+        for person in personalities.get('witnesses_critics', [])
+    ]
+
+
+def _org_context_rows(personalities):
+    return [[key, value] for key, value in personalities.get('organizational_context', {}).items()]
+
+
+def _timeline_rows(timeline):
+    return [
+        [
+            event.get('time', ''),
+            event.get('title', ''),
+            event.get('description', ''),
+            event.get('source', ''),
+            ' | '.join(f"{link.get('name', '')}: {link.get('url', '')}" for link in event.get('sourceLinks', []))
+        ]
+        for event in timeline.get('events', [])
+    ]
+
+
+def _war_crime_detail_rows(war_crimes):
+    return [
+        [
+            crime.get('icon', ''),
+            crime.get('title', ''),
+            crime.get('description', ''),
+            crime.get('sourceLink', ''),
+            crime.get('sourceText', '')
+        ]
+        for crime in war_crimes.get('crimes', [])
+    ]
+
+
+def _testimony_rows(testimonies):
+    return [
+        [
+            witness.get('initials', ''),
+            witness.get('name', ''),
+            witness.get('role', ''),
+            witness.get('testimony', ''),
+            witness.get('source', ''),
+            witness.get('sourceLink', '')
+        ]
+        for witness in testimonies.get('witnesses', [])
+    ]
+
+
+def _source_rows(sources):
+    return [
+        [
+            source.get('icon', ''),
+            source.get('name', ''),
+            source.get('type', ''),
+            source.get('description', ''),
+            source.get('link', ''),
+            source.get('verified', False)
+        ]
+        for source in sources.get('list', [])
+    ]
+
+
+def _exec_summary_rows(exec_summary):
+    return [[f'Para {i + 1}', paragraph] for i, paragraph in enumerate(exec_summary.get('paragraphs', []))]
+
+
+def _intl_law_rows(intl_law):
+    return [
+        [section.get('heading', ''), violation, i + 1]
+        for section in intl_law.get('sections', [])
+        for i, violation in enumerate(section.get('violations', []))
+    ]
+
+
+def _casualty_rows(casualties):
+    return [
+        [
+            item.get('type', ''),
+            item.get('number', ''),
+            item.get('label', ''),
+            item.get('detail', ''),
+            ' | '.join(f"{src.get('name', '')}: {src.get('link', '')}" for src in item.get('sources', []))
+        ]
+        for item in casualties.get('breakdown', [])
+    ]
+
+
+def _impact_rows(impact):
+    return [
+        [section.get('heading', ''), item, i + 1]
+        for section in impact.get('sections', [])
+        for i, item in enumerate(section.get('items', []))
+    ]
+
+
+def _media_image_rows(media):
+    images = media.get('images', {})
+    return ([['local', img] for img in images.get('local', [])] +
+            [['remote', img] for img in images.get('remote', [])])
+
+
+def _media_doc_rows(media):
+    documents = media.get('documents', {})
+    return ([['local', doc] for doc in documents.get('local', [])] +
+            [['remote', doc] for doc in documents.get('remote', [])])
+
+
+def _cta_button_rows(cta):
+    return [
+        [button.get('text', ''), button.get('link', ''), button.get('type', ''), button.get('action', '')]
+        for button in cta.get('buttons', [])
+    ]
+
+
+def _breadcrumb_rows(breadcrumb):
+    return [[item.get('text', ''), item.get('link', '')] for item in breadcrumb.get('items', [])]
+
+
+# Workbook layout, in sheet order: (sheet name, columns, top-level JSON key, row extractor).
+# A key of None means the extractor reads the whole document.
+_SHEET_SPECS = (
+    ('Main Info', ['Field', 'Value'], None, _main_info_rows),
+    ('Location', ['Category', 'Field', 'Value'], 'location', _location_rows),
+    ('Hero Cards', ['Icon', 'Label', 'Value', 'Detail'], 'hero', _hero_card_rows),
+    ('Quick Facts', ['Label', 'Value'], 'quickFacts', _quick_fact_rows),
+    ('Perpetrators', ['Perpetrator'], 'perpetrators', _single_column_rows),
+    ('Commanders', [
+        'Name', 'Name Hebrew/Arabic', 'Birth-Death', 'Role', 'Responsibility',
+        'Later Position 1', 'Later Position 2', 'Later Position 3',
+        'Accountability', 'Notes'
+    ], 'personalities', _commander_rows),
+    ('Witnesses & Critics', [
+        'Name', 'Name Hebrew/Arabic', 'Birth-Death', 'Role', 'Responsibility', 'Notes'
+    ], 'personalities', _witness_rows),
+    ('Org Context', ['Organization', 'Description'], 'personalities', _org_context_rows),
+    ('Timeline', ['Time', 'Title', 'Description', 'Source', 'Source Links'], 'timeline', _timeline_rows),
+    ('War Crimes List', ['War Crime'], 'war_crimes', _single_column_rows),
+    ('War Crimes Detail', ['Icon', 'Title', 'Description', 'Source Link', 'Source Text'],
+     'warCrimes', _war_crime_detail_rows),
+    ('Testimonies', ['Initials', 'Name', 'Role', 'Testimony', 'Source', 'Source Link'],
+     'testimonies', _testimony_rows),
+    ('Sources', ['Icon', 'Name', 'Type', 'Description', 'Link', 'Verified'], 'sources', _source_rows),
+    ('Executive Summary', ['Paragraph', 'Text'], 'executiveSummary', _exec_summary_rows),
+    ('International Law', ['Heading', 'Violation', 'Order'], 'international_law', _intl_law_rows),
+    ('Casualties', ['Type', 'Number', 'Label', 'Detail', 'Sources'], 'casualties', _casualty_rows),
+    ('Historical Impact', ['Heading', 'Item', 'Order'], 'historicalImpact', _impact_rows),
+    ('Media Images', ['Type', 'Source'], 'media', _media_image_rows),
+    ('Media Docs', ['Type', 'Source'], 'media', _media_doc_rows),
+    ('CTA Buttons', ['Text', 'Link', 'Type', 'Action'], 'cta', _cta_button_rows),
+    ('Breadcrumb', ['Text', 'Link'], 'breadcrumb', _breadcrumb_rows),
+)
+
+# Top-level JSON keys read by at least one sheet; everything else is dropped when streaming
+_SHEET_KEYS = frozenset(
+    {key for _, _, key, _ in _SHEET_SPECS if key} | {path.split('.')[0] for _, path in _MAIN_INFO_FIELDS}
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _sheet_plan(keys):
+    """
+    Sheet specs that apply to a document with the given top-level keys.
+    histXXX files share a handful of key layouts, so batch runs compute each plan once.
+    """
+    return tuple(spec for spec in _SHEET_SPECS if spec[2] is None or spec[2] in keys)
 
 
 def json_to_excel(json_file):
@@ -14,305 +324,32 @@ def json_to_excel(json_file):
     excel_file = json_file.replace('.json', '.xlsx')
 
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        data = _load_json(json_file)
     except FileNotFoundError:
         print(f"❌ Error: File '{json_file}' not found")
         return False
-    except json.JSONDecodeError as e:
+    except ValueError as e:
         print(f"❌ Error: Invalid JSON format in '{json_file}' - {e}")
         return False
 
-    # Create Excel writer
-    writer = pd.ExcelWriter(excel_file, engine='openpyxl')
-
-    # Sheet 1: Main Info
-    main_info = {
-        'Field': [
-            'id', 'event_type', 'verification_status',
-            'pageTitle', 'description', 'keywords', 'lastUpdated', 'author',
-            'date_start', 'date_end', 'date_duration_days', 'date_display', 'date_context',
-            'brief_summary',
-            'hero_category', 'hero_title', 'hero_subtitle',
-            'deaths', 'injured', 'forced_displacement'
-        ],
-        'Value': [
-            data.get('id', ''),
-            data.get('event_type', ''),
-            data.get('verification_status', ''),
-            data.get('metadata', {}).get('pageTitle', ''),
-            data.get('metadata', {}).get('description', ''),
-            data.get('metadata', {}).get('keywords', ''),
-            data.get('metadata', {}).get('lastUpdated', ''),
-            data.get('metadata', {}).get('author', ''),
-            data.get('date', {}).get('start', ''),
-            data.get('date', {}).get('end', ''),
-            data.get('date', {}).get('duration_days', ''),
-            data.get('date', {}).get('display', ''),
-            data.get('date', {}).get('context', ''),
-            data.get('brief_summary', ''),
-            data.get('hero', {}).get('category', ''),
-            data.get('hero', {}).get('title', ''),
-            data.get('hero', {}).get('subtitle', ''),
-            data.get('casualties', {}).get('deaths', ''),
-            data.get('casualties', {}).get('injured', ''),
-            data.get('casualties', {}).get('forced_displacement', '')
-        ]
-    }
-    pd.DataFrame(main_info).to_excel(writer, sheet_name='Main Info', index=False)
-
-    # Sheet 2: Location
-    location_data = []
-    if 'location' in data and 'historical' in data['location']:
-        for key, value in data['location']['historical'].items():
-            location_data.append({
-                'Category': 'historical',
-                'Field': key,
-                'Value': str(value) if not isinstance(value, (list, dict)) else json.dumps(value)
-            })
-    if 'location' in data and 'current' in data['location']:
-        for key, value in data['location']['current'].items():
-            location_data.append({
-                'Category': 'current',
-                'Field': key,
-                'Value': str(value) if not isinstance(value, (list, dict)) else json.dumps(value)
-            })
-    pd.DataFrame(location_data).to_excel(writer, sheet_name='Location', index=False)
-
-    # Sheet 3: Hero Meta Cards
-    hero_cards = []
-    if 'hero' in data and 'metaCards' in data['hero']:
-        for card in data['hero']['metaCards']:
-            hero_cards.append({
-                'Icon': card.get('icon', ''),
-                'Label': card.get('label', ''),
-                'Value': card.get('value', ''),
-                'Detail': card.get('detail', '')
-            })
-    pd.DataFrame(hero_cards).to_excel(writer, sheet_name='Hero Cards', index=False)
-
-    # Sheet 4: Quick Facts
-    quick_facts = []
-    if 'quickFacts' in data and 'items' in data['quickFacts']:
-        for item in data['quickFacts']['items']:
-            quick_facts.append({
-                'Label': item.get('label', ''),
-                'Value': item.get('value', '')
-            })
-    pd.DataFrame(quick_facts).to_excel(writer, sheet_name='Quick Facts', index=False)
-
-    # Sheet 5: Perpetrators
-    perpetrators = pd.DataFrame({
-        'Perpetrator': data.get('perpetrators', [])
-    })
-    perpetrators.to_excel(writer, sheet_name='Perpetrators', index=False)
-
-    # Sheet 6: Personalities - Commanders
-    if 'personalities' in data and 'commanders' in data['personalities']:
-        commanders = []
-        for person in data['personalities']['commanders']:
-            commanders.append({
-                'Name': person.get('name', ''),
-                'Name Hebrew/Arabic': person.get('name_hebrew', person.get('name_arabic', '')),
-                'Birth-Death': person.get('birth_death', ''),
-                'Role': person.get('role', ''),
-                'Responsibility': person.get('responsibility', ''),
-                'Later Position 1': person.get('later_positions', [''])[0] if person.get('later_positions') else '',
-                'Later Position 2': person.get('later_positions', ['', ''])[1] if len(
-                    person.get('later_positions', [])) > 1 else '',
-                'Later Position 3': person.get('later_positions', ['', '', ''])[2] if len(
-                    person.get('later_positions', [])) > 2 else '',
-                'Accountability': person.get('accountability', ''),
-                'Notes': person.get('notes', '')
-            })
-        pd.DataFrame(commanders).to_excel(writer, sheet_name='Commanders', index=False)
-
-    # Sheet 7: Witnesses & Critics (if exists in personalities)
-    if 'personalities' in data and 'witnesses_critics' in data['personalities']:
-        witnesses = []
-        for person in data['personalities']['witnesses_critics']:
-            witnesses.append({
-                'Name': person.get('name', ''),
-                'Name Hebrew/Arabic': person.get('name_hebrew', person.get('name_arabic', '')),
-                'Birth-Death': person.get('birth_death', ''),
-                'Role': person.get('role', ''),
-                'Responsibility': person.get('responsibility', ''),
-                'Notes': person.get('notes', '')
-            })
-        pd.DataFrame(witnesses).to_excel(writer, sheet_name='Witnesses & Critics', index=False)
-
-    # Sheet 8: Organizational Context (if exists)
-    if 'personalities' in data and 'organizational_context' in data['personalities']:
-        org_context = []
-        for key, value in data['personalities']['organizational_context'].items():
-            org_context.append({
-                'Organization': key,
-                'Description': value
-            })
-        pd.DataFrame(org_context).to_excel(writer, sheet_name='Org Context', index=False)
-
-    # Sheet 9: Timeline
-    timeline = []
-    if 'timeline' in data and 'events' in data['timeline']:
-        for event in data['timeline']['events']:
-            source_links = []
-            if 'sourceLinks' in event:
-                for link in event['sourceLinks']:
-                    source_links.append(f"{link.get('name', '')}: {link.get('url', '')}")
-            timeline.append({
-                'Time': event.get('time', ''),
-                'Title': event.get('title', ''),
-                'Description': event.get('description', ''),
-                'Source': event.get('source', ''),
-                'Source Links': ' | '.join(source_links)
-            })
-    pd.DataFrame(timeline).to_excel(writer, sheet_name='Timeline', index=False)
-
-    # Sheet 10: War Crimes (simple list if exists)
-    if 'war_crimes' in data:
-        war_crimes_list = pd.DataFrame({
-            'War Crime': data.get('war_crimes', [])
-        })
-        war_crimes_list.to_excel(writer, sheet_name='War Crimes List', index=False)
-
-    # Sheet 11: War Crimes (detailed)
-    if 'warCrimes' in data and 'crimes' in data['warCrimes']:
-        war_crimes = []
-        for crime in data['warCrimes']['crimes']:
-            war_crimes.append({
-                'Icon': crime.get('icon', ''),
-                'Title': crime.get('title', ''),
-                'Description': crime.get('description', ''),
-                'Source Link': crime.get('sourceLink', ''),
-                'Source Text': crime.get('sourceText', '')
-            })
-        pd.DataFrame(war_crimes).to_excel(writer, sheet_name='War Crimes Detail', index=False)
-
-    # Sheet 12: Testimonies
-    testimonies = []
-    if 'testimonies' in data and 'witnesses' in data['testimonies']:
-        for witness in data['testimonies']['witnesses']:
-            testimonies.append({
-                'Initials': witness.get('initials', ''),
-                'Name': witness.get('name', ''),
-                'Role': witness.get('role', ''),
-                'Testimony': witness.get('testimony', ''),
-                'Source': witness.get('source', ''),
-                'Source Link': witness.get('sourceLink', '')
-            })
-    pd.DataFrame(testimonies).to_excel(writer, sheet_name='Testimonies', index=False)
-
-    # Sheet 13: Sources
-    sources = []
-    if 'sources' in data and 'list' in data['sources']:
-        for source in data['sources']['list']:
-            sources.append({
-                'Icon': source.get('icon', ''),
-                'Name': source.get('name', ''),
-                'Type': source.get('type', ''),
-                'Description': source.get('description', ''),
-                'Link': source.get('link', ''),
-                'Verified': source.get('verified', False)
-            })
-    pd.DataFrame(sources).to_excel(writer, sheet_name='Sources', index=False)
-
-    # Sheet 14: Executive Summary
-    if 'executiveSummary' in data and 'paragraphs' in data['executiveSummary']:
-        exec_summary = {
-            'Paragraph': [f'Para {i + 1}' for i in range(len(data['executiveSummary']['paragraphs']))],
-            'Text': data['executiveSummary']['paragraphs']
-        }
-        pd.DataFrame(exec_summary).to_excel(writer, sheet_name='Executive Summary', index=False)
-
-    # Sheet 15: International Law
-    intl_law = []
-    if 'international_law' in data and 'sections' in data['international_law']:
-        for section in data['international_law']['sections']:
-            for i, violation in enumerate(section.get('violations', [])):
-                intl_law.append({
-                    'Heading': section.get('heading', ''),
-                    'Violation': violation,
-                    'Order': i + 1
-                })
-    pd.DataFrame(intl_law).to_excel(writer, sheet_name='International Law', index=False)
-
-    # Sheet 16: Casualties Breakdown
-    casualties = []
-    if 'casualties' in data and 'breakdown' in data['casualties']:
-        for item in data['casualties']['breakdown']:
-            # Handle sources if they exist
-            sources_str = ''
-            if 'sources' in item:
-                sources_list = []
-                for src in item['sources']:
-                    sources_list.append(f"{src.get('name', '')}: {src.get('link', '')}")
-                sources_str = ' | '.join(sources_list)
-
-            casualties.append({
-                'Type': item.get('type', ''),
-                'Number': item.get('number', ''),
-                'Label': item.get('label', ''),
-                'Detail': item.get('detail', ''),
-                'Sources': sources_str
-            })
-    pd.DataFrame(casualties).to_excel(writer, sheet_name='Casualties', index=False)
-
-    # Sheet 17: Historical Impact
-    impact = []
-    if 'historicalImpact' in data and 'sections' in data['historicalImpact']:
-        for section in data['historicalImpact']['sections']:
-            for i, item in enumerate(section.get('items', [])):
-                impact.append({
-                    'Heading': section.get('heading', ''),
-                    'Item': item,
-                    'Order': i + 1
-                })
-    pd.DataFrame(impact).to_excel(writer, sheet_name='Historical Impact', index=False)
-
-    # Sheet 18: Media Images
-    media_images = []
-    if 'media' in data and 'images' in data['media']:
-        for img in data['media']['images'].get('local', []):
-            media_images.append({'Type': 'local', 'Source': img})
-        for img in data['media']['images'].get('remote', []):
-            media_images.append({'Type': 'remote', 'Source': img})
-    pd.DataFrame(media_images).to_excel(writer, sheet_name='Media Images', index=False)
-
-    # Sheet 19: Media Documents
-    media_docs = []
-    if 'media' in data and 'documents' in data['media']:
-        for doc in data['media']['documents'].get('local', []):
-            media_docs.append({'Type': 'local', 'Source': doc})
-        for doc in data['media']['documents'].get('remote', []):
-            media_docs.append({'Type': 'remote', 'Source': doc})
-    pd.DataFrame(media_docs).to_excel(writer, sheet_name='Media Docs', index=False)
-
-    # Sheet 20: CTA Buttons
-    if 'cta' in data and 'buttons' in data['cta']:
-        cta_buttons = []
-        for button in data['cta']['buttons']:
-            cta_buttons.append({
-                'Text': button.get('text', ''),
-                'Link': button.get('link', ''),
-                'Type': button.get('type', ''),
-                'Action': button.get('action', '')
-            })
-        pd.DataFrame(cta_buttons).to_excel(writer, sheet_name='CTA Buttons', index=False)
-
-    # Sheet 21: Breadcrumb (if exists)
-    if 'breadcrumb' in data and 'items' in data['breadcrumb']:
-        breadcrumb = []
-        for item in data['breadcrumb']['items']:
-            breadcrumb.append({
-                'Text': item.get('text', ''),
-                'Link': item.get('link', '')
-            })
-        pd.DataFrame(breadcrumb).to_excel(writer, sheet_name='Breadcrumb', index=False)
-
-    writer.close()
-
-    print(f"✅ Excel file created: {excel_file}")
-    print(f"📊 Number of sheets: {len(pd.ExcelFile(excel_file).sheet_names)}")
+    # Only run the extractors for sections present in this file; empty sections get no sheet at all
+    sheets = []
+    for sheet_name, columns, key, extract in _sheet_plan(frozenset(data)):
+        rows = extract(data if key is None else data[key])
+        if rows:
+            sheets.append((sheet_name, columns, rows))
+
+    wb = _new_workbook()
+    for sheet_name, columns, rows in sheets:
+        _write_sheet(wb, sheet_name, columns, rows)
+
+    # Assemble the whole .xlsx in memory, then hit the disk with a single write
+    buffer = io.BytesIO()
+    wb.save(buffer)
+    with open(excel_file, 'wb') as f:
+        f.write(buffer.getbuffer())
+
+    print(f"✅ Excel file created: {excel_file}\n📊 Number of sheets: {len(sheets)}")
 
     return True
 
@@ -332,16 +369,13 @@ def process_all_json_files():
 
     print(f"📁 Found {len(json_files)} JSON file(s) to convert:\n")
 
-    successful = 0
-    failed = 0
+    # Each file converts independently, so spread them across all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(json_to_excel, sorted(json_files)))
+    print()
 
-    for json_file in sorted(json_files):
-        print(f"🔄 Processing: {json_file}")
-        if json_to_excel(json_file):
-            successful += 1
-        else:
-            failed += 1
-        print()
+    successful = sum(1 for result in results if result)
+    failed = len(results) - successful
 
     print("=" * 60)
     print(f"✅ Successfully converted: {successful}")
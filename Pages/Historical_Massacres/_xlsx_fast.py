@@ -0,0 +1,154 @@
+"""Minimal streaming XLSX writer for plain header + rows sheets.
+
+Each sheet is written straight into the ZIP as inline-string XML, with no cell
+objects, styles or shared-strings table. Only what json_to_excel_universal needs:
+strings, numbers, booleans and empty cells.
+"""
+
+import re
+import zipfile
+from itertools import chain
+
+_CONTENT_TYPES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+    '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+    '<Default Extension="xml" ContentType="application/xml"/>'
+    '<Override PartName="/xl/workbook.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+    '<Override PartName="/xl/styles.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+    '{sheets}</Types>'
+)
+_CONTENT_TYPE_SHEET = (
+    '<Override PartName="/xl/worksheets/sheet{n}.xml" '
+    'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+)
+_ROOT_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '<Relationship Id="rId1" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/officeDocument" '
+    'Target="xl/workbook.xml"/></Relationships>'
+)
+_WORKBOOK = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<workbook xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main" '
+    'xmlns:r="http://schemas.openxmlformats.org/officeDocument/2006/relationships">'
+    '<sheets>{sheets}</sheets></workbook>'
+)
+_WORKBOOK_SHEET = '<sheet name="{name}" sheetId="{n}" r:id="rId{n}"/>'
+_WORKBOOK_RELS = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<Relationships xmlns="http://schemas.openxmlformats.org/package/2006/relationships">'
+    '{sheets}<Relationship Id="rId{styles}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/styles" '
+    'Target="styles.xml"/></Relationships>'
+)
+_WORKBOOK_REL_SHEET = (
+    '<Relationship Id="rId{n}" '
+    'Type="http://schemas.openxmlformats.org/officeDocument/2006/relationships/worksheet" '
+    'Target="worksheets/sheet{n}.xml"/>'
+)
+_STYLES = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<styleSheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+_SHEET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+    '<worksheet xmlns="http://schemas.openxmlformats.org/spreadsheetml/2006/main"><sheetData>'
+)
+_SHEET_TAIL = '</sheetData></worksheet>'
+_ROWS_PER_WRITE = 512
+
+# Control characters XML 1.0 cannot carry; Excel reads them back from _xHHHH_ escapes
+_ILLEGAL_XML = re.compile('[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+
+def _escape(text):
+    """Escape &, < and > (xml.sax.saxutils would pull in urllib and http at import)"""
+    return text.replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def _column_letter(index):
+    """0 -> 'A', 25 -> 'Z', 26 -> 'AA'"""
+    letters = ''
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _text_cell(ref, text):
+    text = _escape(text)
+    if _ILLEGAL_XML.search(text):
+        text = _ILLEGAL_XML.sub(lambda m: f'_x{ord(m.group()):04X}_', text)
+    space = ' xml:space="preserve"' if text[0].isspace() or text[-1].isspace() else ''
+    return f'<c r="{ref}" t="inlineStr"><is><t{space}>{text}</t></is></c>'
+
+
+def _cell(ref, value):
+    """XML for one cell; None and '' are left out so the cell stays empty"""
+    # Almost every cell is a string, so that case is checked first
+    if type(value) is str:
+        return _text_cell(ref, value) if value else ''
+    if value is None:
+        return ''
+    if value is True or value is False:
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, (int, float)) and value == value and value not in (float('inf'), float('-inf')):
+        return f'<c r="{ref}"><v>{value!r}</v></c>'
+    text = str(value)
+    return _text_cell(ref, text) if text else ''
+
+
+class Workbook:
+    """Write sheets into an .xlsx as they are added; call close() to finish the file"""
+
+    def __init__(self, file):
+        self._zip = zipfile.ZipFile(file, 'w', zipfile.ZIP_DEFLATED)
+        self.sheetnames = []
+
+    def add_sheet(self, name, header, rows):
+        """Stream a header row followed by rows (any iterable of sequences) into a new sheet"""
+        self.sheetnames.append(name)
+        part = f'xl/worksheets/sheet{len(self.sheetnames)}.xml'
+        columns = [_column_letter(i) for i in range(len(header))]
+
+        with self._zip.open(part, 'w') as f:
+            # Rows go to the compressor in blocks: one write per row costs more than the XML itself
+            block = [_SHEET_HEAD]
+            for r, row in enumerate(chain((header,), rows), 1):
+                if len(row) > len(columns):
+                    columns.extend(_column_letter(i) for i in range(len(columns), len(row)))
+                cells = ''.join(_cell(f'{column}{r}', value) for column, value in zip(columns, row))
+                block.append(f'<row r="{r}">{cells}</row>')
+                if len(block) >= _ROWS_PER_WRITE:
+                    f.write(''.join(block).encode('utf-8'))
+                    block.clear()
+            block.append(_SHEET_TAIL)
+            f.write(''.join(block).encode('utf-8'))
+
+    def close(self):
+        """Write the workbook-level parts and close the archive"""
+        count = len(self.sheetnames)
+        numbers = range(1, count + 1)
+        self._zip.writestr('[Content_Types].xml', _CONTENT_TYPES.format(
+            sheets=''.join(_CONTENT_TYPE_SHEET.format(n=n) for n in numbers)))
+        self._zip.writestr('_rels/.rels', _ROOT_RELS)
+        self._zip.writestr('xl/workbook.xml', _WORKBOOK.format(
+            sheets=''.join(_WORKBOOK_SHEET.format(name=_escape(name).replace('"', '&quot;'), n=n)
+                           for n, name in zip(numbers, self.sheetnames))))
+        self._zip.writestr('xl/_rels/workbook.xml.rels', _WORKBOOK_RELS.format(
+            sheets=''.join(_WORKBOOK_REL_SHEET.format(n=n) for n in numbers), styles=count + 1))
+        self._zip.writestr('xl/styles.xml', _STYLES)
+        self._zip.close()
@@ -1,347 +1,337 @@
-import json
-import pandas as pd
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment
+import orjson
+import argparse
 import sys
 import os
+import io
+import glob
+from itertools import chain
+from pathlib import Path
+
+# Row labels for the Location, Personalities and Media sheets (named for readability only;
+# CPython already shares these literals, so this is not a speed change)
+_HISTORICAL = 'historical'
+_CURRENT = 'current'
+_COMMANDER = 'commander'
+_WITNESS = 'witness'
+_LOCAL = 'local'
+_REMOTE = 'remote'
+
+
+def _location_value(value):
+    """Cell text for a location field: lists and dicts are stored as JSON"""
+    return str(value) if not isinstance(value, (list, dict)) else orjson.dumps(value).decode('utf-8')
+
+
+def _dig(d, *path, default=''):
+    """Walk nested dicts along path, returning default when a step is missing or None"""
+    for key in path:
+        if not isinstance(d, dict):
+            return default
+        d = d.get(key)
+        if d is None:
+            return default
+    return d
+
+
+# Main Info field names and the JSON path each one is read from
+_MAIN_FIELDS = (
+    'id', 'event_type', 'verification_status', 'pageTitle', 'description', 'keywords',
+    'lastUpdated', 'author', 'date_start', 'date_end', 'date_duration_days', 'date_display',
+    'date_context', 'brief_summary', 'hero_category', 'hero_title', 'hero_subtitle', 'deaths',
+    'injured', 'forced_displacement'
+)
+_MAIN_PATHS = (
+    ('id',), ('event_type',), ('verification_status',), ('metadata', 'pageTitle'),
+    ('metadata', 'description'), ('metadata', 'keywords'), ('metadata', 'lastUpdated'),
+    ('metadata', 'author'), ('date', 'start'), ('date', 'end'), ('date', 'duration_days'),
+    ('date', 'display'), ('date', 'context'), ('brief_summary',), ('hero', 'category'),
+    ('hero', 'title'), ('hero', 'subtitle'), ('casualties', 'deaths'), ('casualties', 'injured'),
+    ('casualties', 'forced_displacement')
+)
+
+
+def _main_info_rows(data):
+    return zip(_MAIN_FIELDS, (_dig(data, *path) for path in _MAIN_PATHS))
+
+
+def _location_rows(data):
+    location = data.get('location', {})
+    for category in (_HISTORICAL, _CURRENT):
+        if category in location:
+            yield from ((category, key, _location_value(value)) for key, value in location[category].items())
+
+
+def _hero_card_rows(data):
+    if 'hero' not in data or 'metaCards' not in data['hero']:
+        return
+    yield from ((card.get('icon', ''), card.get('label', ''), card.get('value', ''), card.get('detail', ''))
+                for card in data['hero']['metaCards'])
+
+
+def _quick_fact_rows(data):
+    if 'quickFacts' not in data or 'items' not in data['quickFacts']:
+        return
+    yield from ((item.get('label', ''), item.get('value', '')) for item in data['quickFacts']['items'])
+
+
+def _perpetrator_rows(data):
+    yield from ((perpetrator,) for perpetrator in data.get('perpetrators', []))
+
+
+def _triple(positions):
+    """First three later positions, padded with ''"""
+    positions = positions or ()
+    return (positions[0] if len(positions) > 0 else '',
+            positions[1] if len(positions) > 1 else '',
+            positions[2] if len(positions) > 2 else '')
+
+
+def _personality_rows(data):
+    if not data.get('personalities'):
+        return
+    personalities = data['personalities']
+    yield from (
+        (person.get('name', ''),
+         person.get('name_hebrew', person.get('name_arabic', '')),
+         person.get('birth_death', ''),
+         person.get('role', ''),
+         person.get('responsibility', ''),
+         *_triple(person.get('later_positions')),
+         person.get('accountability', ''),
+         person.get('notes', ''),
+         _COMMANDER)
+        for person in personalities.get('commanders', [])
+    )
+    yield from (
+        (person.get('name', ''),
+         person.get('name_hebrew', person.get('name_arabic', '')),
+         person.get('birth_death', ''),
+         person.get('role', ''),
+         person.get('responsibility', ''),
+         *_triple(person.get('later_positions'))[:2],
+         '',
+         '',
+         person.get('notes', ''),
+         _WITNESS)
+        for person in personalities.get('witnesses_critics', [])
+    )
+
+
+def _org_context_rows(data):
+    if not data.get('personalities') or 'organizational_context' not in data['personalities']:
+        return
+    yield from data['personalities']['organizational_context'].items()
+
+
+def _timeline_rows(data):
+    if 'timeline' not in data or 'events' not in data['timeline']:
+        return
+    yield from ((event.get('time', ''), event.get('title', ''), event.get('description', ''), event.get('source', ''),
+                 ' | '.join(f"{link.get('name', '')}: {link.get('url', '')}" for link in event.get('sourceLinks', ())))
+                for event in data['timeline']['events'])
+
+
+def _war_crime_list_rows(data):
+    yield from ((crime,) for crime in data.get('war_crimes', []))
+
+
+def _war_crime_detail_rows(data):
+    if 'warCrimes' not in data or 'crimes' not in data['warCrimes']:
+        return
+    yield from ((crime.get('icon', ''), crime.get('title', ''), crime.get('description', ''),
+                 crime.get('sourceLink', ''), crime.get('sourceText', ''))
+                for crime in data['warCrimes']['crimes'])
+
+
+def _testimony_rows(data):
+    if 'testimonies' not in data or 'witnesses' not in data['testimonies']:
+        return
+    yield from ((witness.get('initials', ''), witness.get('name', ''), witness.get('role', ''),
+                 witness.get('testimony', ''), witness.get('source', ''), witness.get('sourceLink', ''))
+                for witness in data['testimonies']['witnesses'])
+
+
+def _source_rows(data):
+    if 'sources' not in data or 'list' not in data['sources']:
+        return
+    yield from ((source.get('icon', ''), source.get('name', ''), source.get('type', ''),
+                 source.get('description', ''), source.get('link', ''), source.get('verified', False))
+                for source in data['sources']['list'])
+
+
+def _exec_summary_rows(data):
+    if 'executiveSummary' not in data or 'paragraphs' not in data['executiveSummary']:
+        return
+    yield from ((f'Para {i + 1}', paragraph) for i, paragraph in enumerate(data['executiveSummary']['paragraphs']))
+
+
+def _intl_law_rows(data):
+    if 'international_law' not in data or 'sections' not in data['international_law']:
+        return
+    yield from ((section.get('heading', ''), violation, i + 1)
+                for section in data['international_law']['sections']
+                for i, violation in enumerate(section.get('violations', [])))
+
+
+def _casualty_rows(data):
+    if 'casualties' not in data or 'breakdown' not in data['casualties']:
+        return
+    yield from ((item.get('type', ''), item.get('number', ''), item.get('label', ''), item.get('detail', ''))
+                for item in data['casualties']['breakdown'])
+
+
+def _impact_rows(data):
+    if 'historicalImpact' not in data or 'sections' not in data['historicalImpact']:
+        return
+    yield from ((section.get('heading', ''), item, i + 1)
+                for section in data['historicalImpact']['sections']
+                for i, item in enumerate(section.get('items', [])))
+
+
+def _media_rows(data, kind):
+    if 'media' not in data or kind not in data['media']:
+        return
+    media = data['media'][kind]
+    yield from ((_LOCAL, source) for source in media.get(_LOCAL, []))
+    yield from ((_REMOTE, source) for source in media.get(_REMOTE, []))
+
+
+def _cta_button_rows(data):
+    if 'cta' not in data or 'buttons' not in data['cta']:
+        return
+    yield from ((button.get('text', ''), button.get('link', ''), button.get('type', ''), button.get('action', ''))
+                for button in data['cta']['buttons'])
+
+
+def _breadcrumb_rows(data):
+    if 'breadcrumb' not in data or 'items' not in data['breadcrumb']:
+        return
+    yield from ((item.get('text', ''), item.get('link', '')) for item in data['breadcrumb']['items'])
+
+
+# (sheet name, header, extractor) in workbook order. Extractors yield row tuples;
+# a sheet with no rows is left out of the workbook.
+_SHEET_SPECS = (
+    ('Main Info', ('Field', 'Value'), _main_info_rows),
+    ('Location', ('Category', 'Field', 'Value'), _location_rows),
+    ('Hero Cards', ('Icon', 'Label', 'Value', 'Detail'), _hero_card_rows),
+    ('Quick Facts', ('Label', 'Value'), _quick_fact_rows),
+    ('Perpetrators', ('Perpetrator',), _perpetrator_rows),
+    ('Personalities', ('Name', 'Name Hebrew/Arabic', 'Birth-Death', 'Role', 'Responsibility',
+                       'Later Position 1', 'Later Position 2', 'Later Position 3',
+                       'Accountability', 'Notes', 'Type'), _personality_rows),
+    ('Org Context', ('Organization', 'Description'), _org_context_rows),
+    ('Timeline', ('Time', 'Title', 'Description', 'Source', 'Source Links'), _timeline_rows),
+    ('War Crimes List', ('War Crime',), _war_crime_list_rows),
+    ('War Crimes Detail', ('Icon', 'Title', 'Description', 'Source Link', 'Source Text'), _war_crime_detail_rows),
+    ('Testimonies', ('Initials', 'Name', 'Role', 'Testimony', 'Source', 'Source Link'), _testimony_rows),
+    ('Sources', ('Icon', 'Name', 'Type', 'Description', 'Link', 'Verified'), _source_rows),
+    ('Executive Summary', ('Paragraph', 'Text'), _exec_summary_rows),
+    ('International Law', ('Heading', 'Violation', 'Order'), _intl_law_rows),
+    ('Casualties', ('Type', 'Number', 'Label', 'Detail'), _casualty_rows),
+    ('Historical Impact', ('Heading', 'Item', 'Order'), _impact_rows),
+    ('Media Images', ('Type', 'Source'), lambda data: _media_rows(data, 'images')),
+    ('Media Docs', ('Type', 'Source'), lambda data: _media_rows(data, 'documents')),
+    ('CTA Buttons', ('Text', 'Link', 'Type', 'Action'), _cta_button_rows),
+    ('Breadcrumb', ('Text', 'Link'), _breadcrumb_rows),
+)
 
 
 def json_to_excel(json_file):
     """Convert any histXXX JSON to Excel workbook with multiple sheets"""
+    # Writer imports live here so the CLI's error paths and --help start instantly
+    import _xlsx_fast
 
-    # Auto-generate Excel filename
-    excel_file = json_file.replace('.json', '.xlsx')
+    # Auto-generate Excel filename (only the final suffix changes: my.json.json -> my.json.xlsx)
+    excel_file = str(Path(json_file).with_suffix('.xlsx'))
 
     try:
-        with open(json_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        with open(json_file, 'rb') as f:
+            data = orjson.loads(f.read())
     except FileNotFoundError:
         print(f"❌ Error: File '{json_file}' not found")
-        sys.exit(1)
-    except json.JSONDecodeError as e:
-        print(f"❌ Error: Invalid JSON format - {e}")
-        sys.exit(1)
-
-    # Create Excel writer
-    writer = pd.ExcelWriter(excel_file, engine='openpyxl')
-
-    # Sheet 1: Main Info
-    main_info = {
-        'Field': [
-            'id', 'event_type', 'verification_status',
-            'pageTitle', 'description', 'keywords', 'lastUpdated', 'author',
-            'date_start', 'date_end', 'date_duration_days', 'date_display', 'date_context',
-            'brief_summary',
-            'hero_category', 'hero_title', 'hero_subtitle',
-            'deaths', 'injured', 'forced_displacement'
-        ],
-        'Value': [
-            data.get('id', ''),
-            data.get('event_type', ''),
-            data.get('verification_status', ''),
-            data.get('metadata', {}).get('pageTitle', ''),
-            data.get('metadata', {}).get('description', ''),
-            data.get('metadata', {}).get('keywords', ''),
-            data.get('metadata', {}).get('lastUpdated', ''),
-            data.get('metadata', {}).get('author', ''),
-            data.get('date', {}).get('start', ''),
-            data.get('date', {}).get('end', ''),
-            data.get('date', {}).get('duration_days', ''),
-            data.get('date', {}).get('display', ''),
-            data.get('date', {}).get('context', ''),
-            data.get('brief_summary', ''),
-            data.get('hero', {}).get('category', ''),
-            data.get('hero', {}).get('title', ''),
-            data.get('hero', {}).get('subtitle', ''),
-            data.get('casualties', {}).get('deaths', ''),
-            data.get('casualties', {}).get('injured', ''),
-            data.get('casualties', {}).get('forced_displacement', '')
-        ]
-    }
-    pd.DataFrame(main_info).to_excel(writer, sheet_name='Main Info', index=False)
-
-    # Sheet 2: Location
-    location_data = []
-
-    # Historical location
-    if 'location' in data and 'historical' in data['location']:
-        for key, value in data['location']['historical'].items():
-            location_data.append({
-                'Category': 'historical',
-                'Field': key,
-                'Value': str(value) if not isinstance(value, (list, dict)) else json.dumps(value)
-            })
-
-    # Current location
-    if 'location' in data and 'current' in data['location']:
-        for key, value in data['location']['current'].items():
-            location_data.append({
-                'Category': 'current',
-                'Field': key,
-                'Value': str(value) if not isinstance(value, (list, dict)) else json.dumps(value)
-            })
-
-    pd.DataFrame(location_data).to_excel(writer, sheet_name='Location', index=False)
-
-    # Sheet 3: Hero Meta Cards
-    hero_cards = []
-    if 'hero' in data and 'metaCards' in data['hero']:
-        for card in data['hero']['metaCards']:
-            hero_cards.append({
-                'Icon': card.get('icon', ''),
-                'Label': card.get('label', ''),
-                'Value': card.get('value', ''),
-                'Detail': card.get('detail', '')
-            })
-    pd.DataFrame(hero_cards).to_excel(writer, sheet_name='Hero Cards', index=False)
-
-    # Sheet 4: Quick Facts
-    quick_facts = []
-    if 'quickFacts' in data and 'items' in data['quickFacts']:
-        for item in data['quickFacts']['items']:
-            quick_facts.append({
-                'Label': item.get('label', ''),
-                'Value': item.get('value', '')
-            })
-    pd.DataFrame(quick_facts).to_excel(writer, sheet_name='Quick Facts', index=False)
-
-    # Sheet 5: Perpetrators
-    perpetrators = pd.DataFrame({
-        'Perpetrator': data.get('perpetrators', [])
-    })
-    perpetrators.to_excel(writer, sheet_name='Perpetrators', index=False)
-
-    # Sheet 6: Personalities - Commanders & Witnesses
-    if 'personalities' in data and data['personalities']:
-        all_personalities = []
-
-        # Commanders
-        for person in data['personalities'].get('commanders', []):
-            all_personalities.append({
-                'Name': person.get('name', ''),
-                'Name Hebrew/Arabic': person.get('name_hebrew', person.get('name_arabic', '')),
-                'Birth-Death': person.get('birth_death', ''),
-                'Role': person.get('role', ''),
-                'Responsibility': person.get('responsibility', ''),
-                'Later Position 1': person.get('later_positions', [''])[0] if person.get('later_positions') else '',
-                'Later Position 2': person.get('later_positions', ['', ''])[1] if len(
-                    person.get('later_positions', [])) > 1 else '',
-                'Later Position 3': person.get('later_positions', ['', '', ''])[2] if len(
-                    person.get('later_positions', [])) > 2 else '',
-                'Accountability': person.get('accountability', ''),
-                'Notes': person.get('notes', ''),
-                'Type': 'commander'
-            })
-
-        # Witnesses
-        for person in data['personalities'].get('witnesses_critics', []):
-            all_personalities.append({
-                'Name': person.get('name', ''),
-                'Name Hebrew/Arabic': person.get('name_hebrew', person.get('name_arabic', '')),
-                'Birth-Death': person.get('birth_death', ''),
-                'Role': person.get('role', ''),
-                'Responsibility': person.get('responsibility', ''),
-                'Later Position 1': person.get('later_positions', [''])[0] if person.get('later_positions') else '',
-                'Later Position 2': person.get('later_positions', ['', ''])[1] if len(
-                    person.get('later_positions', [])) > 1 else '',
-                'Later Position 3': '',
-                'Accountability': '',
-                'Notes': person.get('notes', ''),
-                'Type': 'witness'
-            })
-
-        pd.DataFrame(all_personalities).to_excel(writer, sheet_name='Personalities', index=False)
-
-        # Organizational Context
-        if 'organizational_context' in data['personalities']:
-            org_context = []
-            for key, value in data['personalities']['organizational_context'].items():
-                org_context.append({
-                    'Organization': key,
-                    'Description': value
-                })
-            pd.DataFrame(org_context).to_excel(writer, sheet_name='Org Context', index=False)
-
-    # Sheet 7: Timeline
-    timeline = []
-    if 'timeline' in data and 'events' in data['timeline']:
-        for event in data['timeline']['events']:
-            # Extract source links
-            source_links = []
-            if 'sourceLinks' in event:
-                for link in event['sourceLinks']:
-                    source_links.append(f"{link.get('name', '')}: {link.get('url', '')}")
-
-            timeline.append({
-                'Time': event.get('time', ''),
-                'Title': event.get('title', ''),
-                'Description': event.get('description', ''),
-                'Source': event.get('source', ''),
-                'Source Links': ' | '.join(source_links)
-            })
-    pd.DataFrame(timeline).to_excel(writer, sheet_name='Timeline', index=False)
-
-    # Sheet 8: War Crimes (simple list)
-    war_crimes_list = pd.DataFrame({
-        'War Crime': data.get('war_crimes', [])
-    })
-    war_crimes_list.to_excel(writer, sheet_name='War Crimes List', index=False)
-
-    # Sheet 9: War Crimes (detailed)
-    if 'warCrimes' in data and 'crimes' in data['warCrimes']:
-        war_crimes = []
-        for crime in data['warCrimes']['crimes']:
-            war_crimes.append({
-                'Icon': crime.get('icon', ''),
-                'Title': crime.get('title', ''),
-                'Description': crime.get('description', ''),
-                'Source Link': crime.get('sourceLink', ''),
-                'Source Text': crime.get('sourceText', '')
-            })
-        pd.DataFrame(war_crimes).to_excel(writer, sheet_name='War Crimes Detail', index=False)
-
-    # Sheet 10: Testimonies
-    testimonies = []
-    if 'testimonies' in data and 'witnesses' in data['testimonies']:
-        for witness in data['testimonies']['witnesses']:
-            testimonies.append({
-                'Initials': witness.get('initials', ''),
-                'Name': witness.get('name', ''),
-                'Role': witness.get('role', ''),
-                'Testimony': witness.get('testimony', ''),
-                'Source': witness.get('source', ''),
-                'Source Link': witness.get('sourceLink', '')
-            })
-    pd.DataFrame(testimonies).to_excel(writer, sheet_name='Testimonies', index=False)
-
-    # Sheet 11: Sources
-    sources = []
-    if 'sources' in data and 'list' in data['sources']:
-        for source in data['sources']['list']:
-            sources.append({
-                'Icon': source.get('icon', ''),
-                'Name': source.get('name', ''),
-                'Type': source.get('type', ''),
-                'Description': source.get('description', ''),
-                'Link': source.get('link', ''),
-                'Verified': source.get('verified', False)
-            })
-    pd.DataFrame(sources).to_excel(writer, sheet_name='Sources', index=False)
-
-    # Sheet 12: Executive Summary
-    if 'executiveSummary' in data and 'paragraphs' in data['executiveSummary']:
-        exec_summary = {
-            'Paragraph': [f'Para {i + 1}' for i in range(len(data['executiveSummary']['paragraphs']))],
-            'Text': data['executiveSummary']['paragraphs']
-        }
-        pd.DataFrame(exec_summary).to_excel(writer, sheet_name='Executive Summary', index=False)
-
-    # Sheet 13: International Law
-    intl_law = []
-    if 'international_law' in data and 'sections' in data['international_law']:
-        for section in data['international_law']['sections']:
-            for i, violation in enumerate(section.get('violations', [])):
-                intl_law.append({
-                    'Heading': section.get('heading', ''),
-                    'Violation': violation,
-                    'Order': i + 1
-                })
-    pd.DataFrame(intl_law).to_excel(writer, sheet_name='International Law', index=False)
-
-    # Sheet 14: Casualties Breakdown
-    casualties = []
-    if 'casualties' in data and 'breakdown' in data['casualties']:
-        for item in data['casualties']['breakdown']:
-            casualties.append({
-                'Type': item.get('type', ''),
-                'Number': item.get('number', ''),
-                'Label': item.get('label', ''),
-                'Detail': item.get('detail', '')
-            })
-    pd.DataFrame(casualties).to_excel(writer, sheet_name='Casualties', index=False)
-
-    # Sheet 15: Historical Impact
-    impact = []
-    if 'historicalImpact' in data and 'sections' in data['historicalImpact']:
-        for section in data['historicalImpact']['sections']:
-            for i, item in enumerate(section.get('items', [])):
-                impact.append({
-                    'Heading': section.get('heading', ''),
-                    'Item': item,
-                    'Order': i + 1
-                })
-    pd.DataFrame(impact).to_excel(writer, sheet_name='Historical Impact', index=False)
-
-    # Sheet 16: Media
-    media_images = []
-    if 'media' in data and 'images' in data['media']:
-        for img in data['media']['images'].get('local', []):
-            media_images.append({'Type': 'local', 'Source': img})
-        for img in data['media']['images'].get('remote', []):
-            media_images.append({'Type': 'remote', 'Source': img})
-    pd.DataFrame(media_images).to_excel(writer, sheet_name='Media Images', index=False)
-
-    media_docs = []
-    if 'media' in data and 'documents' in data['media']:
-        for doc in data['media']['documents'].get('local', []):
-            media_docs.append({'Type': 'local', 'Source': doc})
-        for doc in data['media']['documents'].get('remote', []):
-            media_docs.append({'Type': 'remote', 'Source': doc})
-    pd.DataFrame(media_docs).to_excel(writer, sheet_name='Media Docs', index=False)
-
-    # Sheet 17: CTA Buttons
-    if 'cta' in data and 'buttons' in data['cta']:
-        cta_buttons = []
-        for button in data['cta']['buttons']:
-            cta_buttons.append({
-                'Text': button.get('text', ''),
-                'Link': button.get('link', ''),
-                'Type': button.get('type', ''),
-                'Action': button.get('action', '')
-            })
-        pd.DataFrame(cta_buttons).to_excel(writer, sheet_name='CTA Buttons', index=False)
-
-    # Sheet 18: Breadcrumb (if exists)
-    if 'breadcrumb' in data and 'items' in data['breadcrumb']:
-        breadcrumb = []
-        for item in data['breadcrumb']['items']:
-            breadcrumb.append({
-                'Text': item.get('text', ''),
-                'Link': item.get('link', '')
-            })
-        pd.DataFrame(breadcrumb).to_excel(writer, sheet_name='Breadcrumb', index=False)
-
-    writer.close()
+        return False
+    except orjson.JSONDecodeError as e:
+        print(f"❌ Error: Invalid JSON format in '{json_file}' - {e}")
+        return False
+
+    # Assemble the whole .xlsx in memory, then hit the disk with a single write
+    buffer = io.BytesIO()
+    wb = _xlsx_fast.Workbook(buffer)
+
+    for sheet_name, columns, extract in _SHEET_SPECS:
+        # Rows are streamed into the sheet; only the first is pulled early to see if there are any
+        rows = iter(extract(data))
+        first = next(rows, None)
+        if first is not None:
+            wb.add_sheet(sheet_name, columns, chain((first,), rows))
+
+    wb.close()
+    with open(excel_file, 'wb') as f:
+        f.write(buffer.getbuffer())
 
     print(f"✅ Excel file created: {excel_file}")
-    print(f"📊 Number of sheets: {len(writer.sheets)}")
+    print(f"📊 Number of sheets: {len(wb.sheetnames)}")
     print(f"\n📁 Location: {os.path.abspath(excel_file)}")
+    return True
+
+
+def process_all_json_files():
+    """Convert every .json file in the current directory except .translations.json"""
+
+    from concurrent.futures import ProcessPoolExecutor
+
+    json_files = sorted(f for f in glob.glob('*.json') if not f.endswith('.translations.json'))
+
+    if not json_files:
+        print("❌ No JSON files found (excluding .translations.json)")
+        return False
+
+    print(f"📁 Found {len(json_files)} JSON file(s) to convert:\n")
+
+    # Each file converts independently, so spread them across all cores
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        results = list(executor.map(json_to_excel, json_files))
+    print()
+
+    successful = sum(1 for result in results if result)
+    failed = len(results) - successful
+
+    print("=" * 60)
+    print(f"✅ Successfully converted: {successful}")
+    if failed > 0:
+        print(f"❌ Failed: {failed}")
+    return failed == 0
 
 
 # Usage
 if __name__ == "__main__":
-    if len(sys.argv) > 1:
-        json_file = sys.argv[1]
+    parser = argparse.ArgumentParser(description="Convert histXXX JSON files to Excel workbooks")
+    parser.add_argument('json_file', nargs='?', help="JSON file to convert")
+    parser.add_argument('--all', action='store_true',
+                        help="convert every .json file in the current directory (excluding .translations.json)")
+    args = parser.parse_args()
+    if args.all and args.json_file:
+        parser.error("json_file cannot be combined with --all")
+
+    if args.all:
+        sys.exit(0 if process_all_json_files() else 1)
+
+    if args.json_file:
+        json_file = args.json_file
     else:
         # Look for JSON files in current directory
-        json_files = [f for f in os.listdir('.') if f.endswith('.json')]
+        json_files = {f for f in os.listdir('.') if f.endswith('.json')}
 
         if not json_files:
             print("❌ No JSON file found. Usage: python json_to_excel_universal.py <filename.json>")
             sys.exit(1)
 
-        # Prioritize specific files
-        priority_files = ['deir-yassin-1948.json', 'lydda-death-march-1948.json']
-        json_file = None
-
-        for pf in priority_files:
-            if pf in json_files:
-                json_file = pf
-                break
-
-        if not json_file:
-            json_file = json_files[0]
+        # Prioritize specific files, otherwise take the first name alphabetically
+        priority_files = ('deir-yassin-1948.json', 'lydda-death-march-1948.json')
+        json_file = next((pf for pf in priority_files if pf in json_files), None) or min(json_files)
 
         print(f"📄 Using: {json_file}")
 
-    json_to_excel(json_file)
\ No newline at end of file
+    if not json_to_excel(json_file):
+        sys.exit(1)
\ No newline at end of file